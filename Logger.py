@@ -16,6 +16,8 @@ Description :
             record to the specified log file.
         - ANSI escape sequences are removed from the file output using a
             conservative regex; lines are flushed immediately to keep logs live.
+        - With `buffered=True` both channels are flushed only on `flush()`,
+            `close()` and interpreter exit, trading live logs for fewer syscalls.
         - Provides minimal API: `write()`, `flush()` and `close()` so it can be
             used as a drop-in replacement for `sys.stdout`.
 
@@ -37,6 +39,7 @@ Assumptions:
 """
 
 
+import atexit  # For flushing buffered output at interpreter exit
 import os  # For interacting with the filesystem
 import re  # For stripping ANSI escape sequences
 import sys  # For replacing stdout/stderr
@@ -60,15 +63,17 @@ class Logger:
 
     :param logfile_path: Path to the log file.
     :param clean: If True, truncate the log file on init; otherwise append.
+    :param buffered: If True, flush only on flush()/close() and at exit instead of after every write.
     """
 
-    def __init__(self, logfile_path, clean=False):
+    def __init__(self, logfile_path, clean=False, buffered=False):
         """
         Initialize the Logger.
 
         :param self: Instance of the Logger class.
         :param logfile_path: Path to the log file.
         :param clean: If True, truncate the log file on init; otherwise append.
+        :param buffered: If True, flush only on flush()/close() and at exit instead of after every write.
         """
 
         self.logfile_path = logfile_path  # Store log file path
@@ -80,6 +85,10 @@ class Logger:
         mode = "w" if clean else "a"  # Choose file mode based on 'clean' flag
         self.logfile = open(logfile_path, mode, encoding="utf-8")  # Open log file
         self.is_tty = sys.stdout.isatty()  # Verify if stdout is a TTY
+        self.buffered = buffered  # Whether writes are flushed immediately
+
+        if buffered:  # Buffered output must still reach its destinations
+            atexit.register(self.flush)  # Flush whatever is pending when the interpreter exits
 
     def write(self, message):
         """
@@ -96,28 +105,26 @@ class Logger:
         if not out.endswith("\n"):  # Ensure newline termination
             out += "\n"  # Append newline if missing
 
-        clean_out = ANSI_ESCAPE_REGEX.sub("", out)  # Strip ANSI sequences for log file
+        clean_out = ANSI_ESCAPE_REGEX.sub("", out) if "\x1b" in out else out  # Strip ANSI sequences for log file
 
         try:  # Write to log file
             self.logfile.write(clean_out)  # Write cleaned message
-            self.logfile.flush()  # Ensure immediate write
+            if not self.buffered:  # Keep the log live unless buffering was requested
+                self.logfile.flush()  # Ensure immediate write
         except Exception:  # Fail silently to avoid breaking user code
             pass  # Silent fail
 
         try:  # Write to terminal: colored when TTY, cleaned otherwise
             if sys.__stdout__ is not None:
-                if self.is_tty:  # Terminal supports colors
-                    sys.__stdout__.write(out)  # Write colored message
-                    sys.__stdout__.flush()  # Flush immediately
-                else:  # Terminal does not support colors
-                    sys.__stdout__.write(clean_out)  # Write cleaned message
+                sys.__stdout__.write(out if self.is_tty else clean_out)  # Colored when the terminal supports it
+                if not self.buffered:  # Show the message right away unless buffering was requested
                     sys.__stdout__.flush()  # Flush immediately
         except Exception:  # Fail silently to avoid breaking user code
             pass  # Silent fail
 
     def flush(self):
         """
-        Flush the log file.
+        Flush the log file and, in buffered mode, the terminal.
 
         :param self: Instance of the Logger class.
         """
@@ -127,6 +134,13 @@ class Logger:
         except Exception:  # Fail silently
             pass  # Silent fail
 
+        if self.buffered:  # Terminal writes are only flushed here in buffered mode
+            try:  # Flush terminal buffer
+                if sys.__stdout__ is not None:
+                    sys.__stdout__.flush()  # Flush terminal
+            except Exception:  # Fail silently
+                pass  # Silent fail
+
     def close(self):
         """
         Close the log file.
@@ -39,6 +39,8 @@ Dependencies:
     - pathlib
     - json
     - re
+    - orjson (optional, used to write the JSON report when installed)
+    - symspellpy (optional, used to compute spelling suggestions when installed)
 
 Assumptions & Notes:
     - Only .tex files are processed.
@@ -51,18 +53,39 @@ Assumptions & Notes:
 
 import argparse  # argparse used for runtime configuration overrides
 import atexit  # For playing a sound when the program finishes
+import bisect  # For mapping file offsets to line indices
 import datetime  # For getting the current date and time
+import hashlib  # For naming per-file cache entries
+import io  # For re-splitting rewritten file content into lines
 import json  # For generating the JSON report
+import multiprocessing  # For detecting worker processes
 import os  # For filesystem operations
 import platform  # For getting the operating system name
 import re  # For pattern matching
+import shutil  # For copying file permissions onto rewritten files
+import spellchecker  # For the dictionary version used to key the cached reports
+import subprocess  # For playing the notification sound without a shell
 import sys  # For system-specific parameters and functions
+import tempfile  # For writing rewritten files atomically
+import time  # For measuring the execution time with a monotonic clock
 from colorama import Style  # For coloring the terminal
-from functools import partial  # For binding replacement functions in regex
+from concurrent.futures import ProcessPoolExecutor  # For analyzing .tex files in parallel
+from functools import lru_cache  # For caching parsed BibTeX keys
 from Logger import Logger  # For logging output to both terminal and file
 from pathlib import Path  # For handling file paths
 from spellchecker import SpellChecker  # For spell checking
 
+try:  # orjson is optional
+    import orjson  # For fast JSON serialization of the report
+except ImportError:  # Fall back to the standard library serializer
+    orjson = None  # The json module is used instead
+
+try:  # symspellpy is optional
+    import symspellpy  # For the bundled frequency dictionary and the package version
+    from symspellpy import SymSpell, Verbosity  # For fast spelling corrections
+except ImportError:  # Fall back to SpellChecker corrections
+    symspellpy = None  # SpellChecker.correction() is used instead
+
 
 # Macros:
 class BackgroundColors:  # Colors for the terminal
@@ -77,6 +100,11 @@ class BackgroundColors:  # Colors for the terminal
 
 # Execution Constants:
 VERBOSE = False  # Set to True to output verbose messages
+USE_SYMSPELL = True  # Set to False to compute spelling suggestions with SpellChecker even when symspellpy is installed
+CACHE_FILE_REPORTS = True  # Set to False to analyze every .tex file even when its content and the inputs are unchanged since a previous run
+FORCE_ANALYSIS = False  # Set to True to ignore the cached per-file reports for this run (they are still refreshed)
+CURRENT_OS = platform.system()  # Operating system name, identified once at import
+MAX_WORKERS = None  # Number of worker processes used to analyze .tex files (None uses os.cpu_count(), 1 disables parallelism)
 
 
 # File Paths:
@@ -85,6 +113,7 @@ PDF_FILE = f"{ROOT_PATH}main.pdf"  # Compiled PDF used for rendered-output verif
 BIBTEX_FILE = f"{ROOT_PATH}main.bib"  # Compiled PDF used for rendered-output verifications
 GLOSSARY_FILE = f"{ROOT_PATH}entradas-siglas.tex"  # Glossary file used for glossary term verifications
 OUTPUT_REPORT = f"{ROOT_PATH}latex_review_report.json"  # JSON report output path
+CACHE_DIR = "./.latex_review_cache/"  # Directory for on-disk caches (parsed BibTeX keys, per-file reports)
 
 
 # Regex Patterns:
@@ -127,10 +156,85 @@ SAFE_SPELL_FIXES = {
     "teh": "the",
     "recieve": "receive",
 }
+SAFE_SPELL_FIX_CASINGS = {
+    wrong: (right, right.capitalize(), right.upper()) for wrong, right in SAFE_SPELL_FIXES.items()
+}  # Lowercase, capitalized and uppercase forms of every safe fix
+
+
+# Compiled Regex Patterns:
+PRONOUN_REGEXES = [
+    re.compile(pattern) for patterns in PRONOUNS.values() for pattern in patterns
+]  # Pronoun patterns compiled once, in report order
+PRONOUN_ANY_REGEX = re.compile(
+    "|".join(pattern for patterns in PRONOUNS.values() for pattern in patterns)
+)  # Single alternation locating every pronoun occurrence of a line
+SECTION_HEADING_REGEX = re.compile(r"\\(chapter|section|subsection|subsubsection)(\*?)\s*\{([^}]+)\}")  # Match sectioning commands with their titles
+LABEL_REGEX = re.compile(r"\\label\s*\{[^}]+\}")  # Match \label{...} commands
+REPEATED_HYPHENS_REGEX = re.compile(r"-+")  # Match consecutive hyphens in generated labels
+LEADING_INDENT_REGEX = re.compile(r"^(\s*)")  # Match the leading indentation of a line
+BIB_KEY_REGEX = re.compile(r"@\w+\s*\{\s*([^,\s]+)\s*,")  # Match @type{key, entries in .bib files
+GLOSSARY_SIGLA_REGEX = re.compile(r"\\sigla\s*\{\s*([^}]+)\s*\}\s*\{")  # Match \sigla{label}{...}{...} definitions
+GLS_USAGE_REGEX = re.compile(r"\\gls\{([^}]+)\}")  # Match \gls{label} usages
+GLS_PLURAL_REGEX = re.compile(r"\\gls\{([^}]+)\}s")  # Match \gls{label}s plural misuse
+CITE_REGEX = re.compile(r"\\cite[a-zA-Z]*\s*\{([^}]+)\}")  # Match \cite-like commands: \cite, \citep, \citet, etc.
+SAFE_SPELL_FIX_REGEX = re.compile(
+    r"\b(" + "|".join(map(re.escape, sorted(SAFE_SPELL_FIXES, key=len, reverse=True))) + r")\b",
+    re.IGNORECASE,
+)  # Single case-insensitive alternation over every safe spell fix
+SPELL_WORD_REGEX = re.compile(r"(?<!\\)\b([A-Za-z][A-Za-z']+)\b")  # Match candidate words (skip LaTeX commands)
+DECIMAL_REGEX = re.compile(r"\b\d+[.,]\d+\b")  # Match decimal numbers using dot or comma: 1.23 | 10,5 | 0.75
+PERCENTAGE_REGEX = re.compile(r"\b\d+\s*\\%")  # Match percentages written correctly as: 25 \%
+PROPORTION_REGEX = re.compile(r"\b0[.,]\d+\b")  # Match proportions written as decimals: 0.25 | 0,75
+ITEMIZE_BOUNDARY_REGEX = re.compile(r"^\s*%?\s*\\(begin|end)\{itemize\}")  # Match begin{itemize} or end{itemize}, commented or not
+ITEM_REGEX = re.compile(r"^(\s*)(%?\s*\\item\s+)(.*?)(\s*)$")  # Match any \item, commented or not
+ITEM_TRAILING_PUNCTUATION_REGEX = re.compile(r"[.;]\s*$")  # Match trailing punctuation of an \item
+TABLE_ENVIRONMENT_REGEX = re.compile(r"\\(begin|end)\{(tabular|table|longtable)\}")  # Match table-like begin/end environments
+LEADING_WHITESPACE_REGEX = re.compile(r"^([ \t]*)(.*)$")  # Match leading whitespace and the remaining content
+DOUBLE_WHITESPACE_REGEX = re.compile(r"[^ \t]  +")  # Match multiple consecutive spaces after content
+MULTIPLE_SPACES_REGEX = re.compile(r" {2,}")  # Match runs of two or more spaces
+UNDERSCORE_REGEX = re.compile(r"\$[^$]*\$|\\_|_")  # Match inline math, escaped underscores and bare underscores
+PERCENT_MISUSE_REGEX = re.compile(r"(?<=\d)\\?%")  # Match a percent sign right after a number, escaped or not: 10% | 10\%
+COMMENT_START_REGEX = re.compile(r"(?<!\\)(?:\\\\)*%")  # Match the first '%' preceded by an even number of backslashes
+COMMENT_TO_LINE_END_REGEX = re.compile(r"(?<!\\)((?:\\\\)*)%[^\n]*")  # Match an unescaped '%' comment up to the end of its line (keeps the backslashes)
+LINE_TRIGGER_REGEX = re.compile(
+    "|".join(
+        [
+            r"(?P<pronoun>" + PRONOUN_ANY_REGEX.pattern + r")",
+            r"(?P<safe_spell>(?i:" + SAFE_SPELL_FIX_REGEX.pattern + r"))",
+            r"(?P<cite>\\cite)",
+            r"(?P<gls>\\gls\{)",
+            r"(?P<decimal>\d[.,]\d)",
+            r"(?P<percent>" + PERCENT_MISUSE_REGEX.pattern + r")",
+            r"(?P<underscore>_)",
+            r"(?P<double_space>  )",
+            r"(?P<apostrophe>')",
+            r"(?P<unresolved>\?\?)",
+            r"(?P<parentheses>\(\(|\)\))",
+        ]
+    )
+)  # Single scan classifying which detector families can fire on a line (alternatives never overlap)
+
+
+# Translation Tables:
+LABEL_TRANSLATION_TABLE = str.maketrans(
+    {chr(code): None for code in range(128) if chr(code) not in "abcdefghijklmnopqrstuvwxyz0123456789-"} | {" ": "-"}
+)  # Map spaces to hyphens and delete every other ASCII character not allowed in generated labels
+
+
+# Spell Checking Cache:
+SPELL_CHECKER = None  # SpellChecker shared by every file of this process, built on first use by get_spell_checker
+SYMSPELL_CHECKER = None  # SymSpell index used for spelling corrections when symspellpy is installed and USE_SYMSPELL is True
+SPELL_SUGGESTION_CACHE = {}  # Lowercased word -> SpellChecker suggestion (None when the word is known)
+
+
+# Worker State:
+WORKER_CONTEXT = {}  # Per-process state set by initialize_worker: spell, bib_keys, glossary_labels and report_cache_signature
 
 
 # Logger Setup:
-logger = Logger(f"./Logs/{Path(__file__).stem}.log", clean=True)  # Create a Logger instance
+logger = Logger(
+    f"./Logs/{Path(__file__).stem}.log", clean=multiprocessing.parent_process() is None, buffered=True
+)  # Create a Logger instance (worker processes append; output is flushed on demand, after each file and at exit)
 sys.stdout = logger  # Redirect stdout to the logger
 sys.stderr = logger  # Redirect stderr to the logger
 
@@ -176,9 +280,10 @@ def verify_filepath_exists(filepath):
     :return: True if the file or folder exists, False otherwise
     """
 
-    verbose_output(
-        f"{BackgroundColors.GREEN}Verifying if the file or folder exists at the path: {BackgroundColors.CYAN}{filepath}{Style.RESET_ALL}"
-    )  # Output the verbose message
+    if VERBOSE:  # Only build the colored message when it will be printed
+        verbose_output(
+            f"{BackgroundColors.GREEN}Verifying if the file or folder exists at the path: {BackgroundColors.CYAN}{filepath}{Style.RESET_ALL}"
+        )  # Output the verbose message
 
     return os.path.exists(filepath)  # Return True if the file or folder exists, False otherwise
 
@@ -328,7 +433,50 @@ def collect_tex_files(root_path):
     return list(Path(root_path).rglob("*.tex"))  # Return a list of all .tex files under the root path
 
 
-def detect_unresolved_references(filepath, line, line_number, report):
+def read_file_lines(filepath):
+    """
+    Read a UTF-8 text file into a list of lines, keeping line endings.
+
+    :param filepath: Path to the file
+    :return: List of lines
+    """
+
+    with open(filepath, "r", encoding="utf-8") as file:  # Open the file for reading
+        return file.readlines()  # Read all lines from the file into a list
+
+
+def write_file_text(filepath, text):
+    """
+    Atomically replace a UTF-8 text file with the given content.
+
+    The content is written to a temporary file in the same directory, which then
+    replaces the original, so an interrupted run never leaves a truncated file.
+
+    :param filepath: Path to the file
+    :param text: Full file content to write
+    :return: None
+    """
+
+    target = os.path.realpath(filepath)  # Write through symlinks instead of replacing the link with a regular file
+    directory = os.path.dirname(target)  # Same filesystem as the real file, so os.replace is atomic
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=directory, suffix=".tmp", delete=False) as file:  # Create the temporary file
+        temp_path = file.name  # Keep its path for the replace or the cleanup
+        try:  # Write the content, removing the temporary file on failure
+            file.write(text)  # Write the whole content in a single call
+        except BaseException:  # Any error (including KeyboardInterrupt) aborts the rewrite
+            file.close()  # Close before removing (required on Windows)
+            os.remove(temp_path)  # Remove the partial temporary file
+            raise  # Propagate the original error
+
+    try:  # Publish the content, removing the temporary file on failure
+        shutil.copymode(target, temp_path)  # Keep the original permissions instead of the temporary file's 0600
+        os.replace(temp_path, target)  # Swap the rewritten file into place
+    except BaseException:  # The original file may be gone or its directory read-only
+        os.remove(temp_path)  # Never leave a temporary file next to the sources
+        raise  # Propagate the original error
+
+
+def detect_unresolved_references(filepath, line, line_number, report, context=None):
     """
     Detect unresolved LaTeX references.
 
@@ -336,6 +484,7 @@ def detect_unresolved_references(filepath, line, line_number, report):
     :param line: Line content
     :param line_number: Line number
     :param report: Dictionary accumulating the report data
+    :param context: Optional precomputed stripped line, shared by the detectors of a line
     :return: None
     """
 
@@ -345,13 +494,13 @@ def detect_unresolved_references(filepath, line, line_number, report):
                 "file": str(filepath),
                 "line": line_number,
                 "column": line.find("??") + 1,
-                "matched_text": line.strip(),
+                "matched_text": line.strip() if context is None else context,
                 "auto_fixable": False,
             }
         )  # Add the unresolved reference occurrence to the report with relevant details
 
 
-def detect_repeated_left_parentheses_in_line(filepath, line, line_number, report):
+def detect_repeated_left_parentheses_in_line(filepath, line, line_number, report, context=None):
     """
     Detect repeated opening parentheses in a single line and append to report.
 
@@ -359,6 +508,7 @@ def detect_repeated_left_parentheses_in_line(filepath, line, line_number, report
     :param line: Line content
     :param line_number: Line number
     :param report: Dictionary accumulating the report data
+    :param context: Optional precomputed stripped line, shared by the detectors of a line
     :return: None
     """
     
@@ -368,13 +518,13 @@ def detect_repeated_left_parentheses_in_line(filepath, line, line_number, report
                 "file": str(filepath),  # File path where issue was found
                 "line": line_number,  # Line number where issue was found
                 "column": line.find("((") + 1,  # Column index (1-based) of the match
-                "matched_text": line.strip(),  # The matched line context
+                "matched_text": line.strip() if context is None else context,  # The matched line context
                 "auto_fixable": False,  # Not auto-fixable
             }
         )  # End append
 
 
-def detect_repeated_right_parentheses_in_line(filepath, line, line_number, report):
+def detect_repeated_right_parentheses_in_line(filepath, line, line_number, report, context=None):
     """
     Detect repeated closing parentheses in a single line and append to report.
 
@@ -382,6 +532,7 @@ def detect_repeated_right_parentheses_in_line(filepath, line, line_number, repor
     :param line: Line content
     :param line_number: Line number
     :param report: Dictionary accumulating the report data
+    :param context: Optional precomputed stripped line, shared by the detectors of a line
     :return: None
     """
     
@@ -391,13 +542,13 @@ def detect_repeated_right_parentheses_in_line(filepath, line, line_number, repor
                 "file": str(filepath),  # File path where issue was found
                 "line": line_number,  # Line number where issue was found
                 "column": line.find("))") + 1,  # Column index (1-based) of the match
-                "matched_text": line.strip(),  # The matched line context
+                "matched_text": line.strip() if context is None else context,  # The matched line context
                 "auto_fixable": False,  # Not auto-fixable
             }
         )  # End append
 
 
-def detect_repeated_parentheses(filepath, line, line_number, report):
+def detect_repeated_parentheses(filepath, line, line_number, report, context=None):
     """
     Detect repeated opening or closing parentheses.
 
@@ -405,14 +556,15 @@ def detect_repeated_parentheses(filepath, line, line_number, report):
     :param line: Line content
     :param line_number: Line number
     :param report: Dictionary accumulating the report data
+    :param context: Optional precomputed stripped line, shared by the detectors of a line
     :return: None
     """
 
-    detect_repeated_left_parentheses_in_line(filepath, line, line_number, report)  # If there are repeated opening parentheses in the line
-    detect_repeated_right_parentheses_in_line(filepath, line, line_number, report)  # If there are repeated closing parentheses in the line
+    detect_repeated_left_parentheses_in_line(filepath, line, line_number, report, context)  # If there are repeated opening parentheses in the line
+    detect_repeated_right_parentheses_in_line(filepath, line, line_number, report, context)  # If there are repeated closing parentheses in the line
 
 
-def detect_pronouns(filepath, line, line_number, report):
+def detect_pronouns(filepath, line, line_number, report, context=None):
     """
     Detect first-person pronouns.
 
@@ -420,23 +572,35 @@ def detect_pronouns(filepath, line, line_number, report):
     :param line: Line content
     :param line_number: Line number
     :param report: Dictionary accumulating the report data
+    :param context: Optional precomputed stripped line, shared by the detectors of a line
     :return: None
     """
 
-    for lang, patterns in PRONOUNS.items():  # Iterate through each language and its pronoun patterns
-        for pattern in patterns:  # Iterate through each pronoun pattern
-            match = re.search(pattern, line)  # Search for the pronoun pattern in the line
-            if match:  # If a pronoun is found in the line
-                report["pronouns"].append(
-                    {
-                        "file": str(filepath),
-                        "line": line_number,
-                        "pattern": pattern,
-                        "matched_text": match.group(0),
-                        "context": line.strip(),
-                        "auto_fixable": False,
-                    }
-                )  # Add the pronoun occurrence to the report with relevant details
+    if context is None:  # If no shared context was provided
+        context = line.strip()  # Compute the context once for every pronoun of the line
+
+    first_matches = {}  # Pattern index -> first match of that pattern in the line
+
+    for candidate in PRONOUN_ANY_REGEX.finditer(line):  # Pronoun patterns match whole words, so every occurrence starts at a union match
+        start = candidate.start()  # Position of the pronoun occurrence
+        for index, pattern in enumerate(PRONOUN_REGEXES):  # Find which patterns (possibly several languages) match here
+            if index not in first_matches:  # Only the first occurrence of each pattern is reported
+                match = pattern.match(line, start)  # Try the pattern at the occurrence position
+                if match:  # If the pattern matches this occurrence
+                    first_matches[index] = match  # Keep its first match
+
+    for index in sorted(first_matches):  # Report in pattern order, as the per-pattern search did
+        pattern = PRONOUN_REGEXES[index]  # Get the matched pronoun pattern
+        report["pronouns"].append(
+            {
+                "file": str(filepath),
+                "line": line_number,
+                "pattern": pattern.pattern,
+                "matched_text": first_matches[index].group(0),
+                "context": context,
+                "auto_fixable": False,
+            }
+        )  # Add the pronoun occurrence to the report with relevant details
 
 
 def line_is_fully_commented(line):
@@ -447,10 +611,7 @@ def line_is_fully_commented(line):
     :return: True if line is fully commented, False otherwise
     """
 
-    if re.match(r"^\s*%", line):  # If the line is fully commented, skip it safely
-        return True  # Return True when line is fully commented
-    
-    return False  # Return False when line is not fully commented
+    return line.lstrip().startswith("%")  # Fully commented lines start with '%' after their indentation
 
 
 def get_section_heading_match(line):
@@ -461,7 +622,10 @@ def get_section_heading_match(line):
     :return: Match object or None
     """
 
-    heading_match = re.search(r"\\(chapter|section|subsection|subsubsection)(\*?)\s*\{([^}]+)\}", line)  # Match sectioning commands with their titles
+    if "section" not in line and "chapter" not in line:  # Cheap gate: every sectioning command contains one of these
+        return None  # Return None when no heading can match
+
+    heading_match = SECTION_HEADING_REGEX.search(line)  # Match sectioning commands with their titles
     
     if not heading_match:  # If there is no sectioning command in the line, return None
         return None  # Return None when no heading match
@@ -477,7 +641,7 @@ def line_contains_label(line):
     :return: True if line contains a label, False otherwise
     """
 
-    if re.search(r"\\label\s*\{[^}]+\}", line):  # If the line already contains a label, skip it safely
+    if LABEL_REGEX.search(line):  # If the line already contains a label, skip it safely
         return True  # Return True when a label is present
     return False  # Return False when no label is present
 
@@ -494,7 +658,7 @@ def next_line_has_noncomment_label(lines, next_line_index):
     if next_line_index < len(lines):  # If there is a next line to check
         next_line = lines[next_line_index]  # Get the next line content
         
-        if not re.match(r"^\s*%", next_line) and re.search(r"\\label\s*\{[^}]+\}", next_line):  # If the next line is not fully commented and contains a label, skip it safely
+        if not line_is_fully_commented(next_line) and LABEL_REGEX.search(next_line):  # If the next line is not fully commented and contains a label, skip it safely
             return True  # Return True when next line has a non-comment label
         
     return False  # Return False when condition not met
@@ -508,9 +672,9 @@ def generate_label_name_from_title(section_title):
     :return: Sanitized label name string
     """
 
-    label_name = section_title.lower().replace(" ", "-")  # Convert to lowercase and replace spaces with hyphens
-    label_name = re.sub(r"[^a-z0-9-]", "", label_name)  # Remove special characters and keep only alphanumeric, hyphens
-    label_name = re.sub(r"-+", "-", label_name)  # Remove multiple consecutive hyphens
+    label_name = section_title.lower().encode("ascii", "ignore").decode("ascii")  # Convert to lowercase and drop non-ASCII characters
+    label_name = label_name.translate(LABEL_TRANSLATION_TABLE)  # Replace spaces with hyphens and remove special characters in one pass
+    label_name = REPEATED_HYPHENS_REGEX.sub("-", label_name)  # Remove multiple consecutive hyphens
     label_name = label_name.strip("-")  # Remove leading/trailing hyphens
     return label_name  # Return sanitized label name
 
@@ -524,7 +688,7 @@ def construct_label_line_from_line_and_label(line, label_name):
     :return: The constructed label line string (with trailing newline)
     """
 
-    indent_match = re.match(r"^(\s*)", line)  # Create the label line with same indentation as the heading
+    indent_match = LEADING_INDENT_REGEX.match(line)  # Create the label line with same indentation as the heading
     indent = indent_match.group(1) if indent_match else ""  # Extract indentation or use empty string
     label_line = f"{indent}\\label{{sec:{label_name}}}\n"  # Construct the label line with newline
     return label_line  # Return the constructed label line
@@ -610,25 +774,106 @@ def fix_missing_section_labels(filepath, lines, line_index, report):
     return True, True  # Indicate modification applied and label inserted
 
 
-def load_bibtex_keys(bibfile):
+def load_json_cache(name, signature):
     """
-    Load BibTeX entry keys from a .bib file.
+    Load a JSON value from the on-disk cache if it was stored with the same signature.
+
+    :param name: Cache entry name (file name without extension inside CACHE_DIR)
+    :param signature: JSON-serializable value describing the inputs the cached value was built from
+    :return: Cached value, or None when missing, stale or unreadable
+    """
+
+    try:
+        with open(os.path.join(CACHE_DIR, f"{name}.json"), "r", encoding="utf-8") as file:  # Open the cache entry
+            cached = json.load(file)  # Read the stored signature and value
+        if cached["signature"] != json.loads(json.dumps(signature)):  # Tuples are stored as lists, so compare the stored form
+            return None  # Only reuse values built from the same inputs
+        return cached["value"]  # Return the stored value
+    except Exception:
+        return None  # Treat any unreadable or malformed entry as a cache miss
+
+
+def save_json_cache(name, signature, value):
+    """
+    Store a JSON value in the on-disk cache together with its signature.
+
+    :param name: Cache entry name (file name without extension inside CACHE_DIR)
+    :param signature: JSON-serializable value describing the inputs the value was built from
+    :param value: JSON-serializable value to store
+    :return: None
+    """
+
+    file = None  # Temporary file holding the entry until it is complete
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)  # Create the cache directory if needed
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=CACHE_DIR, suffix=".tmp", delete=False) as file:  # Write next to the entry
+            json.dump({"signature": signature, "value": value}, file)  # Store the signature and value
+        os.replace(file.name, os.path.join(CACHE_DIR, f"{name}.json"))  # Publish the entry atomically for concurrent readers
+    except Exception:  # Caching is best effort: a failed write only costs a rebuild next run
+        remove_cache_temp_file(file)  # Do not leave a partial entry behind
+
+
+def remove_cache_temp_file(file):
+    """
+    Remove the temporary file of a cache entry whose write failed.
+
+    :param file: Temporary file object, or None when it was never created
+    :return: None
+    """
+
+    if file is None:  # If the failure happened before the temporary file was created
+        return  # Nothing to remove
+
+    try:
+        os.remove(file.name)  # Remove the partial entry
+    except OSError:
+        pass  # Already published or removed
+
+
+@lru_cache(maxsize=8)
+def load_bibtex_keys_cached(bibfile, mtime_ns, size):
+    """
+    Read and parse a .bib file once per modification time, reusing the keys parsed by previous runs.
 
     :param bibfile: Path to .bib file
-    :return: set of keys (strings)
+    :param mtime_ns: Modification time of the file, used as part of the cache key
+    :param size: Size of the file in bytes, used as part of the cache key
+    :return: frozenset of keys (strings)
     """
 
-    keys = set()  # Initialize empty set for bib keys
+    bibfile = os.path.abspath(bibfile)  # Same cache entry whatever the working directory
+    cache_name = "bibtex_keys_" + hashlib.sha1(bibfile.encode("utf-8")).hexdigest()[:16]  # One cache entry per .bib file
+    signature = (bibfile, mtime_ns, size)  # The keys are valid while the file is unchanged
+
+    keys = load_json_cache(cache_name, signature)  # Reuse the keys parsed by a previous run
+    if keys is not None:  # If the cached keys are still valid
+        return frozenset(keys)  # Skip reading and parsing the .bib file
+
     try:
         with open(bibfile, "r", encoding="utf-8") as f:  # Open bib file for reading
             content = f.read()  # Read the full .bib content
     except Exception:
-        return keys  # Return empty set on error
+        return frozenset()  # Return empty set on error
 
-    for match in re.finditer(r"@\w+\s*\{\s*([^,\s]+)\s*,", content):  # Match @type{key,
-        keys.add(match.group(1))  # Add the matched key to the set
+    keys = frozenset(match.group(1) for match in BIB_KEY_REGEX.finditer(content))  # Match @type{key,
+    save_json_cache(cache_name, signature, sorted(keys))  # Store the keys for the next runs
+    return keys  # Return the parsed keys
 
-    return keys
+
+def load_bibtex_keys(bibfile):
+    """
+    Load BibTeX entry keys from a .bib file.
+
+    :param bibfile: Path to .bib file
+    :return: frozenset of keys (strings)
+    """
+
+    try:
+        stat = os.stat(bibfile)  # Modification time and size used to invalidate the caches
+    except OSError:
+        return frozenset()  # Return empty set on error
+
+    return load_bibtex_keys_cached(bibfile, stat.st_mtime_ns, stat.st_size)  # Reuse the parsed keys while the file is unchanged
 
 
 def load_glossary_labels():
@@ -649,7 +894,7 @@ def load_glossary_labels():
     except Exception:
         return labels  # Return empty set on read/parsing error
     
-    for m in re.finditer(r"\\sigla\s*\{\s*([^}]+)\s*\}\s*\{", content):  # Find \sigla{label}{...}{...}
+    for m in GLOSSARY_SIGLA_REGEX.finditer(content):  # Find \sigla{label}{...}{...}
         try:
             labels.add(m.group(1))  # Add the captured label (first argument) to the set
         except Exception:
@@ -658,23 +903,22 @@ def load_glossary_labels():
     return labels  # Return the set of glossary labels
 
 
-def verify_gls_usage_in_file(filepath, glossary_labels, report):
+def verify_gls_usage_in_lines(filepath, lines, glossary_labels, report):
     r"""
-    Verify that \gls{label} usages reference defined glossary labels.
+    Verify that \gls{label} usages in already loaded file lines reference defined glossary labels.
 
-    :param filepath: Path to the .tex file to scan
+    :param filepath: Path to the .tex file the lines belong to
+    :param lines: List of file lines
     :param glossary_labels: Set of labels loaded from GLOSSARY_FILE
     :param report: Report dictionary to append findings to
     :return: None
     """
 
-    try:
-        with open(filepath, "r", encoding="utf-8") as f:  # Open .tex file for reading
-            lines = f.readlines()  # Read all lines from the file
-    except Exception:
-        return  # Fail silently on file read error
     for line_number, line in enumerate(lines, start=1):  # Iterate lines with 1-based numbering
-        for m in re.finditer(r"\\gls\{([^}]+)\}", line):  # Find all \gls{label} occurrences
+        if "\\gls{" not in line:  # Cheap gate: no glossary command in the line
+            continue  # Continue to next line
+
+        for m in GLS_USAGE_REGEX.finditer(line):  # Find all \gls{label} occurrences
             label = m.group(1)  # Extract the label from the first argument
             if label not in glossary_labels:  # If the label is not defined in glossary set
                 report.setdefault("missing_glossary_terms", []).append(  # Ensure key exists and append entry
@@ -688,7 +932,61 @@ def verify_gls_usage_in_file(filepath, glossary_labels, report):
                 )  # End append
 
 
-def detect_missing_bib_entries(filepath, line, line_number, bib_keys, report):
+def collect_citation_references(line, line_number, cited_refs, context=None):
+    """
+    Collect every \\cite{...} key of a line for a later batched lookup against the .bib keys.
+
+    :param line: Line content
+    :param line_number: Line number
+    :param cited_refs: List accumulating (key, line_number, citation, context) tuples
+    :param context: Optional precomputed stripped line, shared by the detectors of a line
+    :return: None
+    """
+
+    if "\\cite" not in line:  # Cheap gate: no citation command in the line
+        return  # Nothing to do without citations
+
+    if context is None:  # If no shared context was provided
+        context = line.strip()  # Line context shared by every citation of the line
+
+    if context.startswith("%"):  # Ignore fully commented lines (the stripped view starts with the comment marker)
+        return  # Nothing to do for commented lines
+
+    for m in CITE_REGEX.finditer(line):  # Match \cite-like commands: \cite, \citep, \citet, etc.
+        for key in get_citation_keys(m.group(1)):  # citations may be comma-separated
+            cited_refs.append((key, line_number, m.group(0), context))  # Record the citation reference
+
+
+def report_missing_bib_entries(filepath, cited_refs, bib_keys, report):
+    """
+    Append report entries for the collected citation references whose keys are not in bib_keys.
+
+    :param filepath: Path to the .tex file
+    :param cited_refs: List of (key, line_number, citation, context) tuples
+    :param bib_keys: set of keys from .bib
+    :param report: report dict
+    :return: None
+    """
+
+    missing_keys = {ref[0] for ref in cited_refs} - bib_keys  # Resolve every cited key with a single set difference
+    if not missing_keys:  # If every cited key is defined
+        return  # Nothing to report
+
+    for key, line_number, citation, context in cited_refs:  # Iterate references in file order
+        if key in missing_keys:  # If key not found in provided bib keys
+            report["missing_bib_entries"].append(  # Append missing bib entry info to report
+                {
+                    "file": str(filepath),
+                    "line": line_number,
+                    "key": key,
+                    "citation": citation,
+                    "context": context,
+                    "auto_fixable": False,
+                }
+            )  # End append
+
+
+def detect_missing_bib_entries(filepath, line, line_number, bib_keys, report, context=None):
     """
     Detect \\cite{...} usages whose keys are not present in the provided bib_keys set.
 
@@ -697,26 +995,13 @@ def detect_missing_bib_entries(filepath, line, line_number, bib_keys, report):
     :param line_number: Line number
     :param bib_keys: set of keys from .bib
     :param report: report dict
+    :param context: Optional precomputed stripped line, shared by the detectors of a line
     :return: None
     """
 
-    if re.match(r"^\s*%", line):  # Ignore fully commented lines
-        return  # Nothing to do for commented lines
-
-    for m in re.finditer(r"\\cite[a-zA-Z]*\s*\{([^}]+)\}", line):  # Match \cite-like commands: \cite, \citep, \citet, etc.
-        entry_text = m.group(1)  # Extract the citation keys content
-        for key in [k.strip() for k in entry_text.split(",") if k.strip()]:  # citations may be comma-separated
-            if key not in bib_keys:  # If key not found in provided bib keys
-                report["missing_bib_entries"].append(  # Append missing bib entry info to report
-                    {
-                        "file": str(filepath),
-                        "line": line_number,
-                        "key": key,
-                        "citation": m.group(0),
-                        "context": line.strip(),
-                        "auto_fixable": False,
-                    }
-                )  # End append
+    cited_refs = []  # Citation references of this single line
+    collect_citation_references(line, line_number, cited_refs, context)  # Collect the line's citation keys
+    report_missing_bib_entries(filepath, cited_refs, bib_keys, report)  # Report the keys missing from the .bib file
 
 
 def get_citation_keys(inner):
@@ -794,11 +1079,14 @@ def fix_duplicate_citations(filepath, line, line_number, report):
     :return: Tuple (possibly modified line, modification flag)
     """
 
+    if "\\cite" not in line:  # Cheap gate: no citation command in the line
+        return line, False  # Return the original line and False
+
     modified = False  # Track whether the line was modified
 
-    for m in re.finditer(r"(\\cite[a-zA-Z]*\s*\{([^}]+)\})", line):  # Find all \cite-like commands on the line
-        full = m.group(1)  # Full matched \cite{...} text
-        inner = m.group(2)  # Inner keys content
+    for m in CITE_REGEX.finditer(line):  # Find all \cite-like commands on the line
+        full = m.group(0)  # Full matched \cite{...} text
+        inner = m.group(1)  # Inner keys content
         new_line, new_full, was_modified = build_new_citation_and_line(full, inner, line)  # Build replacement if duplicates present
         if not was_modified:  # Nothing to fix when 0 or 1 key or no duplicates
             continue  # Continue with next match
@@ -818,53 +1106,20 @@ def uniq_preserve_order(items):
     :return: List of unique items preserving order
     """
 
-    seen = set()  # Track seen items
-    out = []  # Output list preserving order
-    for it in items:  # Iterate over input items
-        if it not in seen:  # If item not seen before
-            seen.add(it)  # Mark item as seen
-            out.append(it)  # Append item to output preserving order
-    return out  # Return the deduplicated list preserving order
+    return list(dict.fromkeys(items))  # Dict keys keep insertion order and drop duplicates
 
 
-def replacement_preserve_case(m, right):
+def safe_spell_replacement(m):
     """
-    Replacement function for regex that preserves the case of the original word.
+    Replacement function for SAFE_SPELL_FIX_REGEX that looks up the fix for the matched word.
 
     :param m: regex match object
-    :param right: replacement string to use
     :return: replacement string with preserved case
     """
 
     orig = m.group(0)  # Original matched token
-
-    if orig.isupper():  # If the original is all uppercase, return the replacement in uppercase
-        return right.upper()  # Preserve all-uppercase
-
-    if orig[0].isupper():  # If the original is capitalized, return the replacement capitalized
-        return right.capitalize()  # Preserve initial capitalization
-
-    return right  # Default lowercase replacement
-
-
-def replace_safe(s: str):
-    """
-    Apply safe, case-preserving replacements from SAFE_SPELL_FIXES to a string.
-
-    :param s: Input string to process
-    :return: Transformed string with safe replacements applied
-    """
-
-    out = s  # Working copy of the input string
-
-    for wrong, right in SAFE_SPELL_FIXES.items():  # Iterate configured safe fixes
-        out = re.sub(
-            rf"\b{re.escape(wrong)}\b",
-            partial(replacement_preserve_case, right=right),
-            out,
-            flags=re.IGNORECASE,
-        )  # Apply replacement with case-preserving helper bound to `right`
-    return out  # Return transformed string
+    casing = 2 if orig.isupper() else 1 if orig[0].isupper() else 0  # Uppercase, capitalized or lowercase
+    return SAFE_SPELL_FIX_CASINGS[orig.lower()][casing]  # Pick the precomputed form with the same casing
 
 
 def split_code_and_comment(line):
@@ -876,15 +1131,15 @@ def split_code_and_comment(line):
     """
 
     if "%" in line:  # Split off LaTeX comments — do not touch commented text
-        code_part, comment_part = line.split("%", 1)  # Separate code and comment sections
-        comment = "%" + comment_part  # Preserve comment with leading '%'
-    else:
-        code_part = line  # No inline comment present
-        comment = ""  # Empty comment string
-    return code_part, comment  # Return code and comment parts
+        match = COMMENT_START_REGEX.search(line)  # Find the first unescaped '%'
+        if match:  # If the line has an inline comment
+            start = match.end() - 1  # Position of the comment marker itself
+            return line[:start], line[start:]  # Return code and comment parts (comment keeps its leading '%')
+
+    return line, ""  # No inline comment present
 
 
-def apply_safe_replacements(filepath, line_number, report, code_part, original_line):
+def apply_safe_replacements(filepath, line_number, report, code_part, original_line, context=None):
     """
     Apply safe replacements from SAFE_SPELL_FIXES and record the change in report.
 
@@ -893,18 +1148,19 @@ def apply_safe_replacements(filepath, line_number, report, code_part, original_l
     :param report: Report dictionary to append to
     :param code_part: The code portion of the line (no comment)
     :param original_line: The original full line for context
+    :param context: Optional precomputed stripped original_line
     :return: Tuple (possibly modified code_part, modified_flag)
     """
 
-    new_code = replace_safe(code_part)  # Apply safe replacements to code part
-    if new_code != code_part:  # If replacements changed the code part
+    new_code, count = SAFE_SPELL_FIX_REGEX.subn(safe_spell_replacement, code_part)  # Apply every safe fix in a single pass
+    if count:  # Every safe fix changes the word, so any substitution modified the code part
         report["spelling"].append(  # Recorded safe spelling replacement
             {
                 "file": str(filepath),  # File where replacement occurred
                 "line": line_number,  # Line number where replacement occurred
                 "before": code_part.rstrip("\n"),  # Original code part before change
                 "after": new_code.rstrip("\n"),  # New code part after change
-                "context": original_line.strip(),  # Full line context
+                "context": original_line.strip() if context is None else context,  # Full line context
                 "auto_fixable": True,  # Mark as auto-fixable
                 "applied_fix": True,  # Mark as applied
             }
@@ -925,25 +1181,76 @@ def is_ignored_by_safe_spell_fixes(lw):
     return lw in SAFE_SPELL_FIXES  # Membership check against SAFE_SPELL_FIXES
 
 
+def get_spelling_correction(spell, lw):
+    """
+    Return the most likely correction for an unknown word, using the SymSpell
+    index when it is loaded and SpellChecker.correction() otherwise.
+
+    :param spell: SpellChecker instance
+    :param lw: Lowercased word to correct
+    :return: Correction string or None
+    """
+
+    if SYMSPELL_CHECKER is None:  # If SymSpell is not available
+        return spell.correction(lw)  # Fall back to the SpellChecker edit-distance search
+
+    suggestions = SYMSPELL_CHECKER.lookup(lw, Verbosity.TOP, max_edit_distance=2)  # Precomputed deletes index lookup
+    return suggestions[0].term if suggestions else None  # Return the closest most frequent term, if any
+
+
 def get_spell_suggestion_safe(spell, lw):
     """
     Safely query the SpellChecker for a suggestion; return suggestion or None.
+    Results are memoized in SPELL_SUGGESTION_CACHE.
 
     :param spell: SpellChecker instance
     :param lw: Lowercased word to query
     :return: Suggestion string or None
     """
 
+    if lw in SPELL_SUGGESTION_CACHE:  # If the word was already resolved
+        return SPELL_SUGGESTION_CACHE[lw]  # Return the memoized suggestion
+
     try:  # Protect against spellchecker errors
-        if lw not in spell:  # If word is not found in dictionary
-            suggestion = spell.correction(lw)  # Ask spellchecker for a suggestion
-            return suggestion  # Return suggestion (may be None)
-        return None  # Return None when word exists in dictionary
+        known_words = spell.word_frequency.dictionary  # Plain dict of lowercased dictionary words
+        suggestion = get_spelling_correction(spell, lw) if lw not in known_words else None  # Ask for a suggestion only for unknown words
     except Exception:  # On any error from spellchecker
-        return None  # Return None to mimic original exception swallowing
+        suggestion = None  # Return None to mimic original exception swallowing
+
+    SPELL_SUGGESTION_CACHE[lw] = suggestion  # Memoize the result for later occurrences
+    return suggestion  # Return suggestion (may be None)
 
 
-def append_spell_suggestion(report, filepath, line_number, word, suggestion, original_line):
+def prime_spell_suggestion_cache(text, spell):
+    """
+    Resolve every unique candidate word of a file with a single batched
+    SpellChecker query and store the results in SPELL_SUGGESTION_CACHE.
+
+    :param text: Whole file content
+    :param spell: SpellChecker instance
+    :return: None
+    """
+
+    code_text = COMMENT_TO_LINE_END_REGEX.sub(r"\1", text) if "%" in text else text  # Only words outside comments are verified
+    words = set(map(str.lower, SPELL_WORD_REGEX.findall(code_text)))  # Unique lowercased candidate words, in a single scan of the file
+
+    words = {lw for lw in words if lw not in SPELL_SUGGESTION_CACHE and not is_ignored_by_safe_spell_fixes(lw)}  # Skip resolved and safely fixed words
+    if not words:  # If there is nothing new to resolve
+        return  # Nothing to do
+
+    try:  # Protect against spellchecker errors
+        unknown = spell.unknown(words)  # Find every unknown word in a single call
+    except Exception:  # On any error from spellchecker
+        return  # Leave the words to be resolved individually
+
+    for lw in words:  # Iterate through the new candidate words
+        if lw in unknown:  # If the word is not in the dictionary
+            get_spell_suggestion_safe(spell, lw)  # Compute and memoize its suggestion
+        else:  # If the word is known
+            SPELL_SUGGESTION_CACHE[lw] = None  # Known words have no suggestion
+
+
+def append_spell_suggestion(report, filepath, line_number, word, suggestion, context):
     """
     Append a suggestion entry into the report['spelling'] list.
 
@@ -952,7 +1259,7 @@ def append_spell_suggestion(report, filepath, line_number, word, suggestion, ori
     :param line_number: Line number for suggestion
     :param word: Original word
     :param suggestion: Suggested correction
-    :param original_line: Full original line for context
+    :param context: Stripped full line context
     :return: None
     """
 
@@ -962,13 +1269,13 @@ def append_spell_suggestion(report, filepath, line_number, word, suggestion, ori
             "line": line_number,  # Line number for suggestion
             "word": word,  # Original word
             "suggestion": suggestion,  # Suggested correction
-            "context": original_line.strip(),  # Full line context
+            "context": context,  # Full line context
             "auto_fixable": False,  # Suggestion is not auto-fixable
         }
     )  # End append
 
 
-def add_spell_suggestions(filepath, line_number, report, code_part, spell, original_line):
+def add_spell_suggestions(filepath, line_number, report, code_part, spell, original_line, context=None):
     """
     Use a SpellChecker to add suggestions to the report for unknown words.
 
@@ -978,26 +1285,32 @@ def add_spell_suggestions(filepath, line_number, report, code_part, spell, origi
     :param code_part: The code portion of the line (no comment)
     :param spell: SpellChecker instance
     :param original_line: The original full line for context
+    :param context: Optional precomputed stripped original_line (otherwise computed on the first suggestion)
     :return: None
     """
 
-    for m in re.finditer(r"(?<!\\)\b([A-Za-z][A-Za-z']+)\b", code_part):  # Iterate candidate words (skip LaTeX commands and math)
-        word = m.group(1)  # Extract matched word
+    for word in SPELL_WORD_REGEX.findall(code_part):  # Iterate candidate words as plain strings (skip LaTeX commands)
         lw = word.lower()  # Lowercased word for verifications
-        
-        if is_ignored_by_safe_spell_fixes(lw):  # Skip words we already fix safely
+
+        if lw in SPELL_SUGGESTION_CACHE:  # Fast path: words primed for the file are plain dict lookups
+            suggestion = SPELL_SUGGESTION_CACHE[lw]  # Memoized suggestion (None for known words)
+        elif is_ignored_by_safe_spell_fixes(lw):  # Skip words we already fix safely (never cached)
             continue  # Continue to next word
-        
-        suggestion = get_spell_suggestion_safe(spell, lw)  # Query spellchecker safely
-        
+        else:  # Word not resolved yet
+            suggestion = get_spell_suggestion_safe(spell, lw)  # Query spellchecker safely
+
         if suggestion and suggestion.lower() != lw:  # If suggestion differs
-            append_spell_suggestion(report, filepath, line_number, word, suggestion, original_line)  # Add suggestion entry to report
+            if context is None:  # If this is the first suggestion of the line
+                context = sys.intern(original_line.strip())  # Share one context string across the line's suggestions
+            append_spell_suggestion(report, filepath, line_number, word, suggestion, context)  # Add suggestion entry to report
 
 
-def detect_and_fix_spelling(filepath, line, line_number, report, spell=None):
+def detect_and_fix_spelling(filepath, line, line_number, report, spell=None, safe_fixes=True, context=None):
     """
     Apply safe deterministic fixes from SAFE_SPELL_FIXES and, if `spell`
     (a SpellChecker) is provided, add suggestions (no automatic changes).
+    Pass safe_fixes=False when the line is known to contain no SAFE_SPELL_FIXES word,
+    and context when the stripped line is already known.
 
     Returns: (possibly_modified_line, modified_flag)
     """
@@ -1006,16 +1319,18 @@ def detect_and_fix_spelling(filepath, line, line_number, report, spell=None):
 
     modified = False  # Track whether automatic safe fixes were applied
 
-    code_part, was_modified = apply_safe_replacements(filepath, line_number, report, code_part, line)  # Apply safe replacements and record
-    modified = modified or was_modified  # Update modified flag if safe replacements applied
+    if safe_fixes:  # If a safe fix may apply to the line
+        code_part, was_modified = apply_safe_replacements(filepath, line_number, report, code_part, line, context)  # Apply safe replacements and record
+        if was_modified:  # If safe replacements applied
+            modified = True  # Remember that the content changed
 
     if spell is not None:  # If a spellchecker is available, add suggestions (do not auto-fix)
-        add_spell_suggestions(filepath, line_number, report, code_part, spell, line)  # Add suggestions to report
+        add_spell_suggestions(filepath, line_number, report, code_part, spell, line, context)  # Add suggestions to report
 
     return code_part + comment, modified  # Return possibly modified line and whether we changed it
 
 
-def detect_apostrophes(filepath, line, line_number, report):
+def detect_apostrophes(filepath, line, line_number, report, context=None):
     """
     Detect improper apostrophe usage.
 
@@ -1023,6 +1338,7 @@ def detect_apostrophes(filepath, line, line_number, report):
     :param line: Line content
     :param line_number: Line number
     :param report: Dictionary accumulating the report data
+    :param context: Optional precomputed stripped line, shared by the detectors of a line
     :return: None
     """
 
@@ -1031,7 +1347,7 @@ def detect_apostrophes(filepath, line, line_number, report):
             {
                 "file": str(filepath),
                 "line": line_number,
-                "matched_text": line.strip(),
+                "matched_text": line.strip() if context is None else context,
                 "auto_fixable": False,
             }
         )  # End append
@@ -1045,8 +1361,7 @@ def extract_decimals_from_line(line):
     :return: List of decimal strings found
     """
 
-    decimal_pattern = re.compile(r"\b\d+[.,]\d+\b")  # Match decimal numbers using dot or comma: 1.23 | 10,5 | 0.75
-    decimals = decimal_pattern.findall(line)  # Find all decimal numbers in the line
+    decimals = DECIMAL_REGEX.findall(line)  # Find all decimal numbers in the line
     return decimals  # Return list of decimals found
 
 
@@ -1093,11 +1408,8 @@ def find_percentages_and_proportions(line):
     :return: Tuple (percentages, proportions)
     """
 
-    percentage_pattern = re.compile(r"\b\d+\s*\\%")  # Match percentages written correctly as: 25 \%
-    percentages = percentage_pattern.findall(line)  # Find percentage values
-
-    proportion_pattern = re.compile(r"\b0[.,]\d+\b")  # Match proportions written as decimals: 0.25 | 0,75
-    proportions = proportion_pattern.findall(line)  # Find decimal proportions
+    percentages = PERCENTAGE_REGEX.findall(line)  # Find percentage values
+    proportions = PROPORTION_REGEX.findall(line)  # Find decimal proportions
     return percentages, proportions  # Return both lists
 
 
@@ -1121,7 +1433,7 @@ def append_mixed_numeric_representation(report, filepath, line_number):
     )  # End append
 
 
-def detect_numeric_consistency(filepath, line, line_number, report):
+def detect_numeric_consistency(filepath, line, line_number, report, is_comment=None):
     """
     Detect numeric usage consistency.
 
@@ -1135,10 +1447,17 @@ def detect_numeric_consistency(filepath, line, line_number, report):
     :param line: Line content
     :param line_number: Line number
     :param report: Dictionary accumulating the report data
+    :param is_comment: Optional precomputed fully-commented flag, shared by the detectors of a line
     :return: None
     """
 
-    if re.match(r"\s*%", line):  # Ignore fully commented lines
+    if "." not in line and "," not in line:  # Cheap gate: decimals and proportions need a separator
+        return  # Skip analysis safely
+
+    if is_comment is None:  # If the caller did not precompute the flag
+        is_comment = line_is_fully_commented(line)  # Compute it for this line
+
+    if is_comment:  # Ignore fully commented lines
         return  # Skip analysis safely
 
     decimals = extract_decimals_from_line(line)  # Find decimal numbers in the line
@@ -1146,34 +1465,28 @@ def detect_numeric_consistency(filepath, line, line_number, report):
     for number in decimals:  # Iterate through each decimal number found
         append_decimal_reports(filepath, line_number, report, number)  # Append formatting and precision entries for this number
 
+    if "\\%" not in line:  # Cheap gate: a mixed representation needs an escaped percent sign
+        return  # No percentage can be present
+
     percentages, proportions = find_percentages_and_proportions(line)  # Detect percentages and proportions in the line
 
     if percentages and proportions:  # If both representations are used in the same line
         append_mixed_numeric_representation(report, filepath, line_number)  # Record mixed numeric representation issue
 
 
-def is_begin_itemize_line(line):
+def get_itemize_boundary_kind(line):
     """
-    Return True if the provided line marks the beginning of an itemize environment.
+    Return whether the provided line opens or closes an itemize environment.
 
     :param line: Line content to check
-    :return: True if line contains a begin{itemize}
+    :return: "begin", "end", or None when the line is not an itemize boundary
     """
 
-    pattern = re.compile(r"^(\s*)%?\s*\\begin\{itemize\}")  # Regex for begin{itemize}
-    return bool(pattern.search(line))  # Return whether a begin{itemize} was found
+    if "itemize" not in line:  # Cheap substring gate before the regex
+        return None  # Not an itemize boundary
 
-
-def is_end_itemize_line(line):
-    """
-    Return True if the provided line marks the end of an itemize environment.
-
-    :param line: Line content to check
-    :return: True if line contains an end{itemize}
-    """
-
-    pattern = re.compile(r"^(\s*)%?\s*\\end\{itemize\}")  # Regex for end{itemize}
-    return bool(pattern.search(line))  # Return whether an end{itemize} was found
+    match = ITEMIZE_BOUNDARY_REGEX.match(line)  # Match begin{itemize} or end{itemize} in a single regex call
+    return match.group(1) if match else None  # Return the boundary kind, if any
 
 
 def process_item_lines_and_update(lines, item_lines, filepath, report):
@@ -1187,19 +1500,18 @@ def process_item_lines_and_update(lines, item_lines, filepath, report):
     :return: True if any line was modified, False otherwise
     """
 
-    ITEM_PATTERN = re.compile(r"^(\s*)(%?\s*\\item\s+)(.*?)(\s*)$")  # Pattern to parse \item lines
     modified = False  # Track whether any modifications occurred
     
     for idx, line_no in enumerate(item_lines):  # Iterate collected \item line indices
         original = lines[line_no].rstrip("\n")  # Get the original line content
-        match = ITEM_PATTERN.match(original)  # Match the \item line
+        match = ITEM_REGEX.match(original)  # Match the \item line
         
         if not match:  # If the line does not match the \item pattern
             continue  # Skip to the next line
 
         indent, prefix, content, trailing = match.groups()  # Extract groups
 
-        content = re.sub(r"[.;]\s*$", "", content)  # Remove existing punctuation
+        content = ITEM_TRAILING_PUNCTUATION_REGEX.sub("", content)  # Remove existing punctuation
 
         if idx < len(item_lines) - 1:  # Last item ends with ".", others with ";"
             content += ";"  # Add semicolon
@@ -1232,7 +1544,7 @@ def is_table_like_environment_line(line):
     :return: True if line contains a begin/end of tabular/table/longtable
     """
 
-    if re.search(r"\\begin\{(tabular|table|longtable)\}", line) or re.search(r"\\end\{(tabular|table|longtable)\}", line):  # Detect table-like begin/end
+    if "tab" in line and TABLE_ENVIRONMENT_REGEX.search(line):  # Detect table-like begin/end
         return True  # Return True when table-like environment detected
     return False  # Return False when not detected
 
@@ -1245,7 +1557,7 @@ def get_leading_whitespace_match(line):
     :return: Regex Match object or None
     """
 
-    return re.match(r"^([ \t]*)(.*)$", line)  # Match leading whitespace and content
+    return LEADING_WHITESPACE_REGEX.match(line)  # Match leading whitespace and content
 
 
 def process_double_whitespace_and_report(filepath, line_number, report, indent, content, original_line):
@@ -1261,9 +1573,9 @@ def process_double_whitespace_and_report(filepath, line_number, report, indent,
     :return: Tuple (new_line or None, modified_flag)
     """
 
-    if re.search(r"[^ \t]  +", content):  # If there are multiple consecutive spaces in the content
-        fixed_content = re.sub(r" {2,}", " ", content)  # Replace multiple spaces with a single space
-        if fixed_content != content:  # If the content was modified
+    if DOUBLE_WHITESPACE_REGEX.search(content):  # If there are multiple consecutive spaces in the content
+        fixed_content, count = MULTIPLE_SPACES_REGEX.subn(" ", content)  # Replace multiple spaces with a single space
+        if count:  # If any run of spaces was collapsed
             new_line = indent + fixed_content  # Reconstruct the line with original indentation
             report["double_whitespace"].append(  # Append double-whitespace fix to report
                 {
@@ -1296,28 +1608,23 @@ def fix_itemize_punctuation(filepath, lines, report):
     :return: Tuple (possibly modified lines, modification flag)
     """
 
-    ITEM_PATTERN = re.compile(r"^(\s*)(%?\s*\\item\s+)(.*?)(\s*)$")  # Match any \item, commented or not
-
-    in_itemize = False  # Flag indicating if we are inside an itemize environment
-    item_lines = []  # List of line indices for \item lines
+    candidates = [i for i, line in enumerate(lines) if "itemize" in line]  # Indices of the only lines that can open or close an itemize
+    begin_index = None  # Index of the currently open begin{itemize}, if any
     modified = False  # Flag to track if any modifications were made
 
-    for i, line in enumerate(lines):  # Iterate through each line
-        if is_begin_itemize_line(line):  # Detect begin{itemize}, commented or not
-            in_itemize = True  # Set the flag to True
-            item_lines = []  # Reset the list of \item line indices
-            continue  # Continue to the next line
+    for i in candidates:  # Iterate through the candidate boundary lines only
+        kind = get_itemize_boundary_kind(lines[i])  # Detect begin{itemize} or end{itemize}, commented or not
+        if kind == "begin":  # If the line opens an itemize
+            begin_index = i  # Open (or reopen) the itemize region
+            continue  # Continue to the next candidate
 
-        if is_end_itemize_line(line) and in_itemize:  # Detect end{itemize}, commented or not
+        if kind == "end" and begin_index is not None:  # If the line closes the open itemize
+            item_lines = [j for j in range(begin_index + 1, i) if "\\item" in lines[j] and ITEM_REGEX.match(lines[j])]  # Collect the \item lines inside the region
             was_modified = process_item_lines_and_update(lines, item_lines, filepath, report)  # Process collected \item lines
             if was_modified:  # If processing modified any lines
                 modified = True  # Set the modified flag to True
 
-            in_itemize = False  # Reset the flag
-            continue  # Continue to the next line
-
-        if in_itemize and ITEM_PATTERN.match(line):  # If inside itemize and line matches \item
-            item_lines.append(i)  # Collect the line index
+            begin_index = None  # Close the itemize region
 
     return lines, modified  # Return the (possibly modified) lines and modification flag
 
@@ -1336,6 +1643,9 @@ def fix_double_whitespace(filepath, line, line_number, report):
     :return: Tuple (possibly modified line, modification flag)
     """
 
+    if "  " not in line:  # Cheap gate: no consecutive spaces in the line
+        return line, False  # Return the original line and False
+
     if is_table_like_environment_line(line):  # Skip table-like environments
         return line, False  # Return the original line and False
 
@@ -1363,9 +1673,9 @@ def fix_glossary_plural(filepath, line, line_number, report):
     :return: Tuple (possibly modified line, modification flag)
     """
 
-    if r"\gls{" in line and re.search(r"\\gls\{[^}]+\}s", line):  # If there is a glossary plural misuse in the line
-        new_line = re.sub(r"\\gls\{([^}]+)\}s", r"\\glspl{\1}", line)  # Fix the glossary plural misuse
-        if new_line != line:  # If the line was modified
+    if r"\gls{" in line:  # If the line may contain a glossary plural misuse
+        new_line, count = GLS_PLURAL_REGEX.subn(r"\\glspl{\1}", line)  # Fix the glossary plural misuse
+        if count:  # If any \gls{...}s was rewritten
             report["glossary_plural"].append(  # Append glossary plural fix to report
                 {
                     "file": str(filepath),
@@ -1381,6 +1691,17 @@ def fix_glossary_plural(filepath, line, line_number, report):
     return line, False  # Return the original line and False
 
 
+def escape_underscore_replacement(m):
+    """
+    Replacement function for UNDERSCORE_REGEX that escapes only bare underscores.
+
+    :param m: regex match object
+    :return: The escaped underscore, or the matched math/escaped text unchanged
+    """
+
+    return r"\_" if m.group(0) == "_" else m.group(0)  # Keep math segments and already escaped underscores
+
+
 def fix_underscore_misuse(filepath, line, line_number, report):
     """
     Fix unescaped underscores outside math mode.
@@ -1392,8 +1713,8 @@ def fix_underscore_misuse(filepath, line, line_number, report):
     :return: Tuple (possibly modified line, modification flag)
     """
 
-    if "_" in line and not re.search(r"\\_", line):  # If there are unescaped underscores in the line
-        new_line = line.replace("_", r"\_")  # Escape the underscores
+    if "_" in line:  # If there are underscores in the line
+        new_line = UNDERSCORE_REGEX.sub(escape_underscore_replacement, line)  # Escape bare underscores outside math mode in one pass
         if new_line != line:  # If the line was modified
             report["underscore_misuse"].append(  # Append underscore fix to report
                 {
@@ -1410,7 +1731,7 @@ def fix_underscore_misuse(filepath, line, line_number, report):
     return line, False  # Return the original line and False
 
 
-def fix_percentage_misuse(filepath, line, line_number, report):
+def fix_percentage_misuse(filepath, line, line_number, report, is_comment=None):
     """
     Fix percentage usage consistency.
 
@@ -1423,19 +1744,24 @@ def fix_percentage_misuse(filepath, line, line_number, report):
     :param line: Line content
     :param line_number: Line number
     :param report: Dictionary accumulating the report data
+    :param is_comment: Optional precomputed fully-commented flag, shared by the fixers of a line
     :return: Tuple (possibly modified line, modification flag)
     """
 
-    if re.match(r"\s*%", line):  # Ignore fully commented lines
-        return line, False  # Return the
+    if "%" not in line:  # Cheap gate: no percent sign in the line
+        return line, False  # Return the original line and False
 
-    original_line = line  # Store the original line
+    if is_comment is None:  # If the caller did not precompute the flag
+        is_comment = line_is_fully_commented(line)  # Compute it for this line
 
-    line = re.sub(r"(\d)%", r"\1 \\%", line)  # Fix missing backslash before percent: 10% -> 10 \%
+    if is_comment:  # Ignore fully commented lines
+        return line, False  # Return the original line and False
+
+    original_line = line  # Store the original line
 
-    line = re.sub(r"(\d)\\%", r"\1 \\%", line)  # Ensure space before \%: 10\% -> 10 \%
+    line, count = PERCENT_MISUSE_REGEX.subn(r" \\%", line)  # Add the missing backslash and space in one pass: 10% | 10\% -> 10 \%
 
-    if line != original_line:  # If the line was modified
+    if count:  # Every match inserts a space, so any substitution modified the line
         report["percentage_misuse"].append(  # Append percentage fix to report
             {
                 "file": str(filepath),
@@ -1451,7 +1777,42 @@ def fix_percentage_misuse(filepath, line, line_number, report):
     return line, False  # Return the original line and False
 
 
-def analyze_line(filepath, line, line_number, report, bib_keys=None, spell=None):
+def get_line_triggers(line):
+    """
+    Scan a line once with LINE_TRIGGER_REGEX and return the detector families it can trigger.
+
+    :param line: Line content
+    :return: Set of trigger group names found in the line
+    """
+
+    return {m.lastgroup for m in LINE_TRIGGER_REGEX.finditer(line)}  # Collect the named group of every match
+
+
+def get_file_line_triggers(lines, text):
+    """
+    Scan a whole file once with LINE_TRIGGER_REGEX and return the detector families of every line that can trigger any.
+    No trigger alternative matches a newline, so this equals calling get_line_triggers on each line.
+
+    :param lines: List of file lines
+    :param text: The lines joined into a single string
+    :return: Dictionary mapping 0-based line indices (ascending) to their sets of trigger group names
+    """
+
+    line_starts = []  # Offset of the first character of each line in text
+    offset = 0  # Running offset
+    for line in lines:  # Iterate through each line
+        line_starts.append(offset)  # Record where the line starts
+        offset += len(line)  # Advance past the line
+
+    line_triggers = {}  # Line index -> trigger group names
+    for match in LINE_TRIGGER_REGEX.finditer(text):  # Single scan over the whole file
+        index = bisect.bisect_right(line_starts, match.start()) - 1  # Line containing the match
+        line_triggers.setdefault(index, set()).add(match.lastgroup)  # Record the detector family for that line
+
+    return line_triggers  # Return the per-line trigger sets
+
+
+def analyze_line(filepath, line, line_number, report, bib_keys=None, spell=None, cited_refs=None, triggers=None):
     """
     Analyze a single line of a LaTeX file.
 
@@ -1459,74 +1820,364 @@ def analyze_line(filepath, line, line_number, report, bib_keys=None, spell=None)
     :param line: Current line content
     :param line_number: Line number in the file
     :param report: Dictionary accumulating the report data
+    :param cited_refs: Optional list collecting citations for a batched missing-entry check by the caller
+    :param triggers: Optional set of trigger group names already found for this line by a file-level scan
     :return: Tuple (possibly modified line, modification flag)
     """
 
     modified = False  # Flag to track if the line was modified
 
-    detect_unresolved_references(filepath, line, line_number, report)  # Detect unresolved references
-    detect_repeated_parentheses(filepath, line, line_number, report)  # Detect repeated parentheses
-    detect_pronouns(filepath, line, line_number, report)  # Detect first-person pronouns
-    detect_apostrophes(filepath, line, line_number, report)  # Detect improper apostrophe usage
-    detect_numeric_consistency(filepath, line, line_number, report)  # Detect numeric consistency issues
+    if triggers is None:  # If the caller did not scan the file as a whole
+        triggers = get_line_triggers(line)  # Detector families present in the line (fixers never introduce new triggers)
+
+    if not triggers:  # Most prose lines trigger nothing: only spell suggestions can apply
+        if spell is None:  # If no spellchecker is available
+            return line, False  # Nothing can fire on this line
+        return detect_and_fix_spelling(filepath, line, line_number, report, spell, False)  # Suggestions only (no safe fix word in the line)
+
+    context = sys.intern(line.strip())  # Stripped line shared by the read-only detectors
+    if context.startswith("%"):  # Fully commented lines are neither reported nor modified
+        return line, False  # Skip every detector and fixer at once
+
+    if "unresolved" in triggers:  # If the line may contain unresolved references
+        detect_unresolved_references(filepath, line, line_number, report, context)  # Detect unresolved references
+    if "parentheses" in triggers:  # If the line may contain repeated parentheses
+        detect_repeated_parentheses(filepath, line, line_number, report, context)  # Detect repeated parentheses
+    if "pronoun" in triggers:  # If the line may contain pronouns
+        detect_pronouns(filepath, line, line_number, report, context)  # Detect first-person pronouns
+    if "apostrophe" in triggers:  # If the line may contain apostrophes
+        detect_apostrophes(filepath, line, line_number, report, context)  # Detect improper apostrophe usage
+    if "decimal" in triggers:  # If the line may contain decimal numbers
+        detect_numeric_consistency(filepath, line, line_number, report, False)  # Detect numeric consistency issues (the line is not commented)
+
+    if cited_refs is not None and "cite" in triggers:  # If the caller batches the missing-entry check
+        collect_citation_references(line, line_number, cited_refs, context)  # Collect citations for the batched check
+    elif bib_keys is not None and "cite" in triggers:  # If BibTeX keys are provided and the line may contain citations
+        detect_missing_bib_entries(filepath, line, line_number, bib_keys, report, context)  # Detect missing BibTeX entries
+
+    if "cite" in triggers:  # If the line may contain citations
+        line, dup_cite_modified = fix_duplicate_citations(filepath, line, line_number, report)  # Fix duplicate keys in \cite
+        if dup_cite_modified:  # If duplicates fixed
+            modified = True  # Remember that the content changed
+
+    if spell is not None or "safe_spell" in triggers:  # If suggestions are requested or a safe fix may apply
+        line, spelling_modified = detect_and_fix_spelling(
+            filepath, line, line_number, report, spell, "safe_spell" in triggers, None if modified else context
+        )  # Detect and fix spelling, skipping the safe fixes when the trigger scan found none (the context is stale once the line changed)
+        if spelling_modified:  # If spelling changed
+            modified = True  # Remember that the content changed
+
+    if "double_space" in triggers:  # If the line may contain multiple consecutive spaces
+        line, double_whitespace_modified = fix_double_whitespace(filepath, line, line_number, report)  # Fix multiple consecutive spaces
+        if double_whitespace_modified:  # If the fixer changed the line
+            modified = True  # Remember that the content changed
+
+    if "gls" in triggers:  # If the line may contain glossary commands
+        line, glossary_modified = fix_glossary_plural(filepath, line, line_number, report)  # Fix glossary plural misuse
+        if glossary_modified:  # If the fixer changed the line
+            modified = True  # Remember that the content changed
+
+    if "underscore" in triggers:  # If the line may contain underscores
+        line, underscore_modified = fix_underscore_misuse(filepath, line, line_number, report)  # Fix underscore misuse
+        if underscore_modified:  # If the fixer changed the line
+            modified = True  # Remember that the content changed
+
+    if "percent" in triggers:  # If the line may contain a percent sign right after a number
+        line, percentage_modified = fix_percentage_misuse(filepath, line, line_number, report, False)  # Fix percentage misuse (the line is not commented)
+        if percentage_modified:  # If the fixer changed the line
+            modified = True  # Remember that the content changed
+
+    return line, modified  # Return the (possibly modified) line and modification flag
+
 
-    if bib_keys is not None:  # If BibTeX keys are provided
-        detect_missing_bib_entries(filepath, line, line_number, bib_keys, report)  # Detect missing BibTeX entries
+def analyze_file(filepath, report, bib_keys=None, spell=None, glossary_labels=None, lines=None) -> tuple[str, bool]:
+    """
+    Analyze a single LaTeX file and apply safe auto-fixes.
+
+    :param filepath: Path to the .tex file
+    :param report: Dictionary accumulating the report data
+    :param glossary_labels: Optional set of glossary labels; when given, \\gls usages are verified on the final lines
+    :param lines: Optional file lines already read by the caller; the file is read when None
+    :return: None
+    """
 
-    line, dup_cite_modified = fix_duplicate_citations(filepath, line, line_number, report)  # Fix duplicate keys in \cite
-    modified = modified or dup_cite_modified  # Update modified flag if duplicates fixed
+    filepath = str(filepath)  # Convert once: every report entry stores str(filepath), which is then a no-op
+    if lines is None:  # If the caller did not read the file already
+        lines = read_file_lines(filepath)  # Read all lines from the file into a list
+    text = "".join(lines)  # Whole file content, used to skip passes that cannot fire anywhere in the file
 
-    line, spelling_modified = detect_and_fix_spelling(filepath, line, line_number, report, spell)  # Detect and fix spelling
-    modified = modified or spelling_modified  # Update modified flag if spelling changed
+    modified = False  # Flag to track if the file was modified
 
-    line, double_whitespace_modified = fix_double_whitespace(filepath, line, line_number, report)  # Fix multiple consecutive spaces
-    modified = modified or double_whitespace_modified  # Update modification flag
+    has_headings = "section" in text or "chapter" in text  # Sectioning commands are the only label-pass trigger
+    heading_indices = [i for i, line in enumerate(lines) if "section" in line or "chapter" in line] if has_headings else []  # Only lines that can hold a heading
+    inserted = 0  # Number of label lines inserted so far (shifts the later candidate indices)
+    for heading_index in heading_indices:  # Visit the candidate lines only, never the inserted labels
+        was_modified, label_inserted = fix_missing_section_labels(filepath, lines, heading_index + inserted, report)  # Attempt to insert missing label
+        if was_modified:  # If a label was inserted into the file
+            modified = True  # Remember that the content changed
+        if label_inserted:  # If a label was inserted just after current line
+            inserted += 1  # Later original lines moved down by one
 
-    line, glossary_modified = fix_glossary_plural(filepath, line, line_number, report)  # Fix glossary plural misuse
-    modified = modified or glossary_modified  # Update modification flag
+    if modified:  # If labels were inserted, the joined text no longer matches the lines
+        text = "".join(lines)  # Rebuild it so it matches the current lines
 
-    line, underscore_modified = fix_underscore_misuse(filepath, line, line_number, report)  # Fix underscore misuse
-    modified = modified or underscore_modified  # Update modification flag
+    if spell is not None:  # If a spellchecker is available
+        prime_spell_suggestion_cache(text, spell)  # Resolve the file's unique words in one batch
 
-    line, percentage_modified = fix_percentage_misuse(filepath, line, line_number, report)  # Fix percentage misuse
-    modified = modified or percentage_modified  # Update modification flag
+    cited_refs = [] if bib_keys is not None else None  # Citations collected for a single missing-entry check per file
 
-    return line, modified  # Return the (possibly modified) line and modification flag
+    line_triggers = get_file_line_triggers(lines, text)  # One scan of the whole file instead of one per line
 
+    line_indices = range(len(lines)) if spell is not None else line_triggers  # Without spelling only triggered lines can change
+    for index in line_indices:  # Iterate through the lines to analyze, in file order
+        line, was_modified = analyze_line(
+            filepath, lines[index], index + 1, report, bib_keys, spell, cited_refs, line_triggers.get(index, frozenset())
+        )  # Analyze a single line for issues and fixes
+        if was_modified:  # If any fix was applied to the line
+            modified = True  # Remember that the content changed
+            lines[index] = line  # Replace list entry with the modified line
 
-def analyze_file(filepath, report, bib_keys=None, spell=None) -> tuple[str, bool]:
+    if cited_refs:  # If any citation was collected
+        report_missing_bib_entries(filepath, cited_refs, bib_keys, report)  # Report keys missing from the .bib file
+
+    if modified:  # If the file was modified (unmodified files are never written)
+        text = "".join(lines)  # Final content, joined once for the write and the glossary verification
+        write_file_text(filepath, text)  # Write the modified content back to the file
+
+    if glossary_labels is not None:  # If glossary usages should be verified without re-reading the file
+        final_lines = io.StringIO(text).readlines() if modified else lines  # Re-split so line numbers match the written file
+        verify_gls_usage_in_lines(filepath, final_lines, glossary_labels, report)  # Verify \gls usages against glossary labels
+            
+    return str(filepath), modified
+
+
+def write_json_report(report, output_path):
+    """
+    Write the report dictionary to a JSON file, using orjson when it is installed.
+
+    :param report: Dictionary accumulating the report data
+    :param output_path: Path of the JSON report
+    :return: None
+    """
+
+    if orjson is not None:  # If the C-backed serializer is available
+        data = orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)  # Serialize straight to bytes
+        with open(output_path, "wb") as file:  # Open the output report file for writing
+            file.write(data)  # Write the serialized report
+        return  # Report written
+
+    with open(output_path, "w", encoding="utf-8") as file:  # Open the output report file for writing
+        json.dump(report, file, indent=3)  # Write the report dictionary to the JSON file
+
+
+def get_spell_checker():
+    """
+    Return the process-wide SpellChecker, loading its dictionary on first use.
+
+    :return: SpellChecker instance
+    """
+
+    global SPELL_CHECKER  # The shared instance lives at module level
+
+    if SPELL_CHECKER is None:  # If the dictionary was not loaded yet in this process (or inherited from the parent)
+        SPELL_CHECKER = SpellChecker()  # Load the dictionary (this may take some time on first run)
+
+    if SYMSPELL_CHECKER is None and symspellpy is not None and USE_SYMSPELL:  # If SymSpell should be used but is not loaded yet
+        load_symspell_checker()  # Build its index alongside the SpellChecker
+
+    return SPELL_CHECKER  # Return the shared instance
+
+
+def load_symspell_checker():
+    """
+    Build the SymSpell index from the frequency dictionary bundled with symspellpy.
+    The index is built once per run (workers inherit it when forked): unpickling it
+    is only about twice as fast as building it and needs a ~19 MB cache entry.
+
+    :return: None
     """
-    Analyze a single LaTeX file and apply safe auto-fixes.
+
+    global SYMSPELL_CHECKER  # The shared index lives at module level
+
+    try:  # Protect against a missing or unreadable dictionary
+        sym_spell = SymSpell(max_dictionary_edit_distance=2, prefix_length=7)  # Same edit distance as SpellChecker
+        dictionary_path = os.path.join(os.path.dirname(symspellpy.__file__), "frequency_dictionary_en_82_765.txt")  # Bundled English frequency list
+        if not sym_spell.load_dictionary(dictionary_path, term_index=0, count_index=1):  # Build the deletes index
+            return  # Keep using SpellChecker corrections
+    except Exception:  # On any error from symspellpy
+        return  # Keep using SpellChecker corrections
+
+    SYMSPELL_CHECKER = sym_spell  # Share the index with every file of this process
+
+
+def get_report_cache_signature(bib_keys, glossary_labels):
+    """
+    Digest everything besides the file content that a per-file report depends on:
+    the script itself, the spell checking backends and the shared inputs.
+    Call it after get_spell_checker, so the backend actually loaded is recorded.
+
+    :param bib_keys: set of keys from .bib
+    :param glossary_labels: Set of labels loaded from GLOSSARY_FILE
+    :return: Hex digest string
+    """
+
+    digest = hashlib.sha256()  # Accumulate every input into a single digest
+    digest.update(Path(__file__).read_bytes())  # Any change to the detectors invalidates every cached report
+    digest.update(repr(getattr(spellchecker, "__version__", None)).encode("utf-8"))  # Suggestions depend on the dictionary
+    digest.update(repr(getattr(symspellpy, "__version__", None) if SYMSPELL_CHECKER is not None else None).encode("utf-8"))  # And on the backend that was loaded, not the one configured
+    digest.update(repr(sorted(bib_keys) if bib_keys is not None else None).encode("utf-8"))  # Missing-entry checks depend on the .bib keys
+    digest.update(repr(sorted(glossary_labels) if glossary_labels is not None else None).encode("utf-8"))  # \gls checks depend on the glossary
+    return digest.hexdigest()  # Return the combined digest
+
+
+def load_cached_file_report(filepath):
+    """
+    Return the report a previous run produced for this file with the same inputs.
+    An unchanged modification time and size is trusted without reading the file;
+    otherwise the content is hashed and compared with the cached hash, and the
+    lines decoded from those same bytes are returned for the analysis.
 
     :param filepath: Path to the .tex file
+    :return: Tuple (cached report or None, cache entry to store a new report under or None, file lines or None)
+    """
+
+    try:
+        stat = os.stat(filepath)  # Taken before reading, so a concurrent edit only causes a rehash next run
+    except OSError:
+        return None, None, None  # Let the analysis report the unreadable file as usual
+
+    stat_key = [stat.st_mtime_ns, stat.st_size]  # Cheap change detection (a list, as stored in the JSON entry)
+    cache_name = "file_report_" + hashlib.sha1(os.path.abspath(filepath).encode("utf-8")).hexdigest()[:16]  # One cache entry per .tex file
+    signature = [str(filepath), WORKER_CONTEXT["report_cache_signature"]]  # Path as reported and every other input
+    cached = None if WORKER_CONTEXT["force_analysis"] else load_json_cache(cache_name, signature)  # {"stat", "sha256", "report"}
+    if not isinstance(cached, dict) or not isinstance(cached.get("report"), dict):  # If the entry is missing or malformed
+        cached = None  # Analyze the file as if nothing was cached
+
+    if cached is not None and cached.get("stat") == stat_key:  # If the file was not touched since the report was stored
+        return cached["report"], None, None  # Reuse the report without reading the file
+
+    try:
+        content = Path(filepath).read_bytes()  # Read once: the hashed bytes are the analyzed bytes
+    except Exception:
+        return None, None, None  # Let the analysis report the unreadable file as usual
+
+    content_hash = hashlib.sha256(content).hexdigest()  # Raw content, hashed without decoding
+    cache_entry = (cache_name, signature, stat_key, content_hash)  # Everything needed to store a report for this content
+    if cached is not None and cached.get("sha256") == content_hash:  # If the file was touched but its content is the same
+        save_cached_file_report(cache_entry, cached["report"])  # Refresh the stored stat so the next run skips the hash
+        return cached["report"], None, None  # Reuse the report
+
+    try:
+        lines = io.TextIOWrapper(io.BytesIO(content), encoding="utf-8").readlines()  # Same decoding and newline handling as read_file_lines
+    except UnicodeDecodeError:
+        return None, None, None  # Let the analysis report the undecodable file as usual
+
+    return None, cache_entry, lines  # The file must be analyzed
+
+
+def save_cached_file_report(cache_entry, report):
+    """
+    Store a per-file report under the cache entry returned by load_cached_file_report.
+
+    :param cache_entry: Tuple (cache_name, signature, stat_key, content_hash)
+    :param report: Report dictionary produced for the file
+    :return: None
+    """
+
+    cache_name, signature, stat_key, content_hash = cache_entry  # Unpack the cache entry
+    save_json_cache(cache_name, signature, {"stat": stat_key, "sha256": content_hash, "report": report})  # Store the report with its change detectors
+
+
+def initialize_worker(bib_keys, glossary_labels, report_cache_signature=None, force_analysis=False):
+    """
+    Initialize a process that analyzes files (a pool worker, or the main process when running serially)
+    once: get its SpellChecker and store the shared read-only inputs.
+
+    :param bib_keys: set of keys from .bib
+    :param glossary_labels: Set of labels loaded from GLOSSARY_FILE
+    :param report_cache_signature: Digest from get_report_cache_signature, or None to disable the per-file report cache
+    :param force_analysis: If True, analyze every file and only refresh the cached reports
+    :return: None
+    """
+
+    WORKER_CONTEXT["spell"] = get_spell_checker()  # Reuse the dictionary inherited from the parent, or load it once per worker
+    WORKER_CONTEXT["bib_keys"] = bib_keys  # Store the BibTeX keys for every file handled by this worker
+    WORKER_CONTEXT["glossary_labels"] = glossary_labels  # Store the glossary labels for every file handled by this worker
+    WORKER_CONTEXT["report_cache_signature"] = report_cache_signature  # Store the inputs digest used to validate cached reports
+    WORKER_CONTEXT["force_analysis"] = force_analysis  # Store whether cached reports must be ignored
+
+
+def process_file(filepath):
+    """
+    Analyze a single .tex file into its own report, using the state set by initialize_worker.
+
+    :param filepath: Path to the .tex file
+    :return: Report dictionary for the file
+    """
+
+    try:  # Pool workers exit through os._exit, which skips the atexit flush of the buffered logger
+        cache_entry = None  # Cache entry of the file, when the per-file report cache is enabled
+        lines = None  # File lines already read by the cache lookup
+        if WORKER_CONTEXT["report_cache_signature"] is not None:  # If reports of unchanged files may be reused
+            cached_report, cache_entry, lines = load_cached_file_report(filepath)  # Look up a report for this unchanged file
+            if cached_report is not None:  # If a previous run already analyzed this content with the same inputs
+                return cached_report  # Skip every detector
+
+        report = initialize_report()  # Per-file report merged by the main process
+        _, modified = analyze_file(
+            filepath, report, WORKER_CONTEXT["bib_keys"], WORKER_CONTEXT["spell"], WORKER_CONTEXT["glossary_labels"], lines
+        )  # Analyze the file with the worker's state (and the lines whose hash is cached)
+
+        if cache_entry is not None and not modified:  # Files rewritten by fixes have new content and are analyzed again next run
+            save_cached_file_report(cache_entry, report)  # Store the report for the next runs
+
+        return report  # Return the per-file report
+    finally:
+        sys.stdout.flush()  # Hand this file's output to the terminal and log file before the worker can exit
+
+
+def merge_reports(report, partial_report):
+    """
+    Extend each category of the report with the entries of a partial report.
+
+    :param report: Report dictionary to merge into
+    :param partial_report: Report dictionary produced for a single file
+    :return: None
+    """
+
+    for category, entries in partial_report.items():  # Iterate through each report category
+        if entries:  # Skip empty categories
+            report.setdefault(category, []).extend(entries)  # Append the entries preserving file order
+
+
+def analyze_files_in_parallel(tex_files, report, bib_keys, glossary_labels, workers, report_cache_signature=None, force_analysis=False):
+    """
+    Analyze .tex files across worker processes and merge their reports in file order.
+
+    :param tex_files: List of .tex file paths
     :param report: Dictionary accumulating the report data
+    :param bib_keys: set of keys from .bib
+    :param glossary_labels: Set of labels loaded from GLOSSARY_FILE
+    :param workers: Number of worker processes
+    :param report_cache_signature: Digest from get_report_cache_signature, or None to disable the per-file report cache
+    :param force_analysis: If True, analyze every file and only refresh the cached reports
     :return: None
     """
 
-    with open(filepath, "r", encoding="utf-8") as file:  # Open the file for reading
-        lines = file.readlines()  # Read all lines from the file into a list
+    chunksize = max(1, len(tex_files) // (workers * 4))  # About four batches per worker: few round-trips, balanced tails
+    mp_context = None  # Use the platform's default start method unless fork is preferred
 
-    modified = False  # Flag to track if the file was modified
+    if CURRENT_OS == "Linux":  # Fork is the safe and cheap start method on Linux
+        mp_context = multiprocessing.get_context("fork")  # Children inherit the parent's memory copy-on-write
+        get_spell_checker()  # Load the dictionary once here so every forked worker shares its pages
 
-    line_index = 0  # Start index for first-pass modifications
-    while line_index < len(lines):  # Iterate through lines allowing insertions
-        was_modified, label_inserted = fix_missing_section_labels(filepath, lines, line_index, report)  # Attempt to insert missing label
-        modified = modified or was_modified  # Update file-level modified flag
-        if label_inserted:  # If a label was inserted just after current line
-            line_index += 2  # Skip over the newly inserted label line
-        else:
-            line_index += 1  # Move to next original line
-
-    for line_number, line in enumerate(lines, start=1):  # Iterate through each line with line numbers
-        line, was_modified = analyze_line(filepath, line, line_number, report, bib_keys, spell)  # Analyze a single line for issues and fixes
-        modified = modified or was_modified  # Update modification flag if any fixes applied
-        lines[line_number - 1] = str(line)  # Replace list entry with possibly modified line
-
-    if modified:  # If the file was modified
-        with open(filepath, "w", encoding="utf-8") as file:  # Open the file for writing
-            file.writelines(lines)  # Write the modified lines back to the file
-            
-    return str(filepath), modified
+    sys.stdout.flush()  # Flush buffered output so forked workers do not inherit and re-emit it
+
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=mp_context, initializer=initialize_worker, initargs=(bib_keys, glossary_labels, report_cache_signature, force_analysis)
+    ) as executor:  # Start the worker processes
+        for partial_report in executor.map(process_file, tex_files, chunksize=chunksize):  # Results arrive in file order
+            merge_reports(report, partial_report)  # Merge the per-file report
 
 
 def to_seconds(obj):
@@ -1566,7 +2217,9 @@ def calculate_execution_time(start_time, finish_time=None):
     Returns a string like "1h 2m 3s".
     """
 
-    if finish_time is None:  # Single-argument mode: start_time already represents duration or seconds
+    if finish_time is None and isinstance(start_time, (int, float)):  # Fast path: elapsed seconds, as passed by main
+        total_seconds = float(start_time)  # Already a duration in seconds
+    elif finish_time is None:  # Single-argument mode: start_time already represents duration or seconds
         total_seconds = to_seconds(start_time)  # Try to convert provided value to seconds
         if total_seconds is None:  # Conversion failed
             try:  # Attempt numeric coercion
@@ -1593,10 +2246,9 @@ def calculate_execution_time(start_time, finish_time=None):
     if total_seconds < 0:  # Normalize negative durations
         total_seconds = abs(total_seconds)  # Use absolute value
 
-    days = int(total_seconds // 86400)  # Compute full days
-    hours = int((total_seconds % 86400) // 3600)  # Compute remaining hours
-    minutes = int((total_seconds % 3600) // 60)  # Compute remaining minutes
-    seconds = int(total_seconds % 60)  # Compute remaining seconds
+    minutes, seconds = divmod(int(total_seconds), 60)  # Split whole seconds into minutes and remaining seconds
+    hours, minutes = divmod(minutes, 60)  # Split minutes into hours and remaining minutes
+    days, hours = divmod(hours, 24)  # Split hours into days and remaining hours
 
     if days > 0:  # Include days when present
         return f"{days}d {hours}h {minutes}m {seconds}s"  # Return formatted days+hours+minutes+seconds
@@ -1615,13 +2267,23 @@ def play_sound():
     :return: None
     """
 
-    current_os = platform.system()  # Get the current operating system
+    current_os = CURRENT_OS  # Get the current operating system
     if current_os == "Windows":  # If the current operating system is Windows
         return  # Do nothing
 
     if verify_filepath_exists(SOUND_FILE):  # If the sound file exists
         if current_os in SOUND_COMMANDS:  # If the platform.system() is in the SOUND_COMMANDS dictionary
-            os.system(f"{SOUND_COMMANDS[current_os]} {SOUND_FILE}")  # Play the sound
+            try:  # The player may be missing from PATH
+                subprocess.Popen(
+                    [SOUND_COMMANDS[current_os], SOUND_FILE],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )  # Play the sound in the background without a shell, so exiting does not wait for playback
+            except OSError:  # If the player could not be started
+                print(
+                    f"{BackgroundColors.RED}Could not run {BackgroundColors.CYAN}{SOUND_COMMANDS[current_os]}{BackgroundColors.RED} to play the sound.{Style.RESET_ALL}"
+                )
         else:  # If the platform.system() is not in the SOUND_COMMANDS dictionary
             print(
                 f"{BackgroundColors.RED}The {BackgroundColors.CYAN}{current_os}{BackgroundColors.RED} is not in the {BackgroundColors.CYAN}SOUND_COMMANDS dictionary{BackgroundColors.RED}. Please add it!{Style.RESET_ALL}"
@@ -1645,27 +2307,40 @@ def main():
         end="\n\n",
     )  # Output the welcome message
     start_time = datetime.datetime.now()  # Get the start time of the program
+    start_perf = time.perf_counter()  # Monotonic start time used for the execution time
 
     report = initialize_report()  # Initialize the report dictionary
     analyze_pdf(report)  # First Pass: Rendered-Output verifications (PDF)
     tex_files = collect_tex_files(ROOT_PATH)  # Collect all .tex files under the root path
 
     bib_keys = load_bibtex_keys(BIBTEX_FILE)  # Load BibTeX keys from the .bib file
-    spell = SpellChecker()  # Initialize the spell checker (this may take some time on first run due to loading dictionaries)
     glossary_labels = load_glossary_labels()  # Load glossary labels once from GLOSSARY_FILE
 
-    for tex_file in tex_files:  # Iterate through each .tex file
-        analyze_file(tex_file, report, bib_keys, spell)  # Analyze the file and update the report
-
-    for tex_file in tex_files:  # Iterate through each .tex file for glossary verification
-        verify_gls_usage_in_file(tex_file, glossary_labels, report)  # Verify \gls usages against loaded glossary labels
-
-    with open(OUTPUT_REPORT, "w", encoding="utf-8") as file:  # Open the output report file for writing
-        json.dump(report, file, indent=3)  # Write the report dictionary to the JSON file
+    workers = min(MAX_WORKERS or os.cpu_count() or 1, len(tex_files))  # Never start more workers than files
+    if tex_files:  # The dictionaries are never loaded when there is nothing to check
+        get_spell_checker()  # Load the spelling backends once, before any worker is forked
+        print(
+            f"{BackgroundColors.GREEN}Spelling suggestions backend: {BackgroundColors.CYAN}{'SymSpell' if SYMSPELL_CHECKER is not None else 'SpellChecker'}{Style.RESET_ALL}"
+        )  # Output the backend selected by USE_SYMSPELL and the installed packages
+    report_cache_signature = (
+        get_report_cache_signature(bib_keys, glossary_labels) if CACHE_FILE_REPORTS and tex_files else None
+    )  # Inputs digest validating the reports cached for unchanged files
+
+    if workers > 1:  # If several files can be analyzed at once
+        analyze_files_in_parallel(
+            tex_files, report, bib_keys, glossary_labels, workers, report_cache_signature, FORCE_ANALYSIS
+        )  # Analyze files across worker processes
+    elif tex_files:  # Analyze the files in this process
+        initialize_worker(bib_keys, glossary_labels, report_cache_signature, FORCE_ANALYSIS)  # Same per-process state as a worker (reuses the loaded dictionary)
+        for partial_report in map(process_file, tex_files):  # Analyze each file into its own report, in file order
+            merge_reports(report, partial_report)  # Extend the shared report once per category and file
+
+    write_json_report(report, OUTPUT_REPORT)  # Write the report dictionary to the JSON file
 
     finish_time = datetime.datetime.now()  # Get the finish time of the program
+    elapsed_seconds = time.perf_counter() - start_perf  # Execution time, unaffected by wall-clock adjustments
     print(
-        f"{BackgroundColors.GREEN}Start time: {BackgroundColors.CYAN}{start_time.strftime('%d/%m/%Y - %H:%M:%S')}\n{BackgroundColors.GREEN}Finish time: {BackgroundColors.CYAN}{finish_time.strftime('%d/%m/%Y - %H:%M:%S')}\n{BackgroundColors.GREEN}Execution time: {BackgroundColors.CYAN}{calculate_execution_time(start_time, finish_time)}{Style.RESET_ALL}"
+        f"{BackgroundColors.GREEN}Start time: {BackgroundColors.CYAN}{start_time.strftime('%d/%m/%Y - %H:%M:%S')}\n{BackgroundColors.GREEN}Finish time: {BackgroundColors.CYAN}{finish_time.strftime('%d/%m/%Y - %H:%M:%S')}\n{BackgroundColors.GREEN}Execution time: {BackgroundColors.CYAN}{calculate_execution_time(elapsed_seconds)}{Style.RESET_ALL}"
     )  # Output the start and finish times
     print(
         f"\n{BackgroundColors.BOLD}{BackgroundColors.GREEN}Program finished.{Style.RESET_ALL}"
@@ -1685,6 +2360,8 @@ def create_arg_parser():
 
     parser = argparse.ArgumentParser(description="LaTeX-Reviewer configuration overrides")  # Initialize argument parser for CLI overrides
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")  # Add verbose flag argument
+    parser.add_argument("--force", action="store_true", help="Analyze every file, ignoring cached per-file reports")  # Add force re-analysis flag argument
+    parser.add_argument("--workers", type=int, dest="workers", help="Override MAX_WORKERS")  # Add worker count override argument
     parser.add_argument("--root-path", type=str, dest="root_path", help="Override ROOT_PATH")  # Add root path override argument
     parser.add_argument("--pdf-file", type=str, dest="pdf_file", help="Override PDF_FILE")  # Add PDF file override argument
     parser.add_argument("--bibtex-file", type=str, dest="bibtex_file", help="Override BIBTEX_FILE")  # Add BibTeX file override argument
@@ -1700,12 +2377,16 @@ def apply_cli_overrides(args):
     :return: None
     """
 
-    global VERBOSE, ROOT_PATH, PDF_FILE, BIBTEX_FILE, GLOSSARY_FILE, OUTPUT_REPORT  # Declare module-level configuration variables as global
+    global VERBOSE, FORCE_ANALYSIS, MAX_WORKERS, ROOT_PATH, PDF_FILE, BIBTEX_FILE, GLOSSARY_FILE, OUTPUT_REPORT  # Declare module-level configuration variables as global
 
     if args is None: return  # Exit early if no arguments were provided
 
     if getattr(args, "verbose", False): VERBOSE = True  # Enable verbose mode if flag is set
 
+    if getattr(args, "force", False): FORCE_ANALYSIS = True  # Ignore cached per-file reports if flag is set
+
+    if getattr(args, "workers", None) is not None: MAX_WORKERS = max(1, args.workers)  # Override MAX_WORKERS if provided
+
     if getattr(args, "root_path", None) is not None: ROOT_PATH = args.root_path  # Override ROOT_PATH if provided
 
     if getattr(args, "pdf_file", None) is not None: PDF_FILE = args.pdf_file  # Override PDF_FILE if explicitly provided